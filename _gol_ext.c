@@ -0,0 +1,156 @@
+/* C extension with the hot grid update for gameoflife.py.
+ *
+ * The interior of the board (everything off the first/last row and column)
+ * never wraps, so it is updated with plain indexing; when compiled with AVX2
+ * the Moore-neighbourhood interior is done 32 cells at a time, summing the
+ * eight neighbour rows with byte adds and applying the born/survive rules
+ * through an in-register shuffle lookup. Border cells wrap via modulo, as in
+ * the Python per-cell path.
+ *
+ * Build in place with: python setup.py build_ext --inplace
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+/* Update one (possibly wrapping) cell. Only used for the border. */
+static inline void
+update_cell(const uint8_t *in, uint8_t *out, int height, int width,
+            int i, int j, const uint8_t *born, const uint8_t *survive,
+            int moore)
+{
+    int im1 = (i - 1 + height) % height;
+    int ip1 = (i + 1) % height;
+    int jm1 = (j - 1 + width) % width;
+    int jp1 = (j + 1) % width;
+    unsigned count = in[im1 * width + j] + in[ip1 * width + j]
+                   + in[i * width + jm1] + in[i * width + jp1];
+    if (moore)
+        count += in[im1 * width + jm1] + in[im1 * width + jp1]
+               + in[ip1 * width + jm1] + in[ip1 * width + jp1];
+    out[i * width + j] = in[i * width + j] ? survive[count] : born[count];
+}
+
+static PyObject *
+update(PyObject *self, PyObject *args)
+{
+    Py_buffer in_buf, out_buf, born_buf, survive_buf;
+    int height, width, moore;
+
+    if (!PyArg_ParseTuple(args, "y*w*iiy*y*i", &in_buf, &out_buf,
+                          &height, &width, &born_buf, &survive_buf, &moore))
+        return NULL;
+
+    if (in_buf.len < (Py_ssize_t)height * width
+            || out_buf.len < (Py_ssize_t)height * width) {
+        PyBuffer_Release(&in_buf);
+        PyBuffer_Release(&out_buf);
+        PyBuffer_Release(&born_buf);
+        PyBuffer_Release(&survive_buf);
+        PyErr_SetString(PyExc_ValueError,
+                        "grid buffers are smaller than height * width");
+        return NULL;
+    }
+
+    const uint8_t *in = in_buf.buf;
+    uint8_t *out = out_buf.buf;
+
+    /* Neighbour counts never exceed 8, so 16-byte rule tables are enough
+     * (and are exactly what one shuffle lane can look up). */
+    uint8_t born[16] = {0}, survive[16] = {0};
+    memcpy(born, born_buf.buf, born_buf.len < 16 ? born_buf.len : 16);
+    memcpy(survive, survive_buf.buf,
+           survive_buf.len < 16 ? survive_buf.len : 16);
+
+#ifdef __AVX2__
+    const __m256i born_lut = _mm256_broadcastsi128_si256(
+        _mm_loadu_si128((const __m128i *)born));
+    const __m256i survive_lut = _mm256_broadcastsi128_si256(
+        _mm_loadu_si128((const __m128i *)survive));
+    const __m256i zero = _mm256_setzero_si256();
+#endif
+
+    for (int i = 1; i < height - 1; i++) {
+        const uint8_t *up = in + (i - 1) * width;
+        const uint8_t *mid = in + i * width;
+        const uint8_t *down = in + (i + 1) * width;
+        uint8_t *dst = out + i * width;
+        int j = 1;
+#ifdef __AVX2__
+        if (moore) {
+            for (; j + 32 <= width - 1; j += 32) {
+                __m256i count = _mm256_loadu_si256((const __m256i *)(up + j - 1));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(up + j)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(up + j + 1)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(mid + j - 1)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(mid + j + 1)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(down + j - 1)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(down + j)));
+                count = _mm256_add_epi8(count,
+                    _mm256_loadu_si256((const __m256i *)(down + j + 1)));
+                __m256i centre = _mm256_loadu_si256((const __m256i *)(mid + j));
+                /* Look the counts up in both rule tables, then keep the
+                 * survive result for live cells and the born result for
+                 * dead ones. */
+                __m256i born_res = _mm256_shuffle_epi8(born_lut, count);
+                __m256i survive_res = _mm256_shuffle_epi8(survive_lut, count);
+                __m256i dead = _mm256_cmpeq_epi8(centre, zero);
+                _mm256_storeu_si256((__m256i *)(dst + j),
+                    _mm256_blendv_epi8(survive_res, born_res, dead));
+            }
+        }
+#endif
+        for (; j < width - 1; j++) {
+            unsigned count = up[j] + down[j] + mid[j - 1] + mid[j + 1];
+            if (moore)
+                count += up[j - 1] + up[j + 1] + down[j - 1] + down[j + 1];
+            dst[j] = mid[j] ? survive[count] : born[count];
+        }
+    }
+
+    /* The first/last rows and columns wrap, so take the modulo path. */
+    for (int j = 0; j < width; j++) {
+        update_cell(in, out, height, width, 0, j, born, survive, moore);
+        update_cell(in, out, height, width, height - 1, j, born, survive,
+                    moore);
+    }
+    for (int i = 1; i < height - 1; i++) {
+        update_cell(in, out, height, width, i, 0, born, survive, moore);
+        update_cell(in, out, height, width, i, width - 1, born, survive,
+                    moore);
+    }
+
+    PyBuffer_Release(&in_buf);
+    PyBuffer_Release(&out_buf);
+    PyBuffer_Release(&born_buf);
+    PyBuffer_Release(&survive_buf);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef methods[] = {
+    {"update", update, METH_VARARGS,
+     "update(grid, out, height, width, born, survive, moore)\n\n"
+     "Advance a uint8 toroidal board one generation, writing into out."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "_gol_ext",
+    "Compiled grid update for gameoflife.py.", -1, methods
+};
+
+PyMODINIT_FUNC
+PyInit__gol_ext(void)
+{
+    return PyModule_Create(&module);
+}
@@ -23,6 +23,237 @@ import sys
 import time
 from shutil import get_terminal_size
 
+# numba is optional; it is only needed for the 'numba' update method.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# The compiled extension is optional too; it is only needed for the 'c'
+# update method, and is built with `python setup.py build_ext --inplace`.
+try:
+    import _gol_ext
+except ImportError:
+    _gol_ext = None
+
+# cupy is optional as well; it is only needed for the 'gpu' update method.
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Tile edge for the blocked numba update. 64x64 uint8 tiles sit comfortably
+# in L1, so the input neighbourhood stays in cache while the tile is written.
+_BLOCK = 64
+
+# Thread-block shape for the GPU kernel: each block updates a 32x8 tile of
+# the board from a shared-memory copy with a one-cell halo.
+_GPU_BLOCK = (32, 8)
+
+if cupy is not None:
+    _gpu_update = cupy.RawKernel(r'''
+    #define BX 32
+    #define BY 8
+
+    extern "C" __global__
+    void update(const unsigned char* __restrict__ in,
+                unsigned char* __restrict__ out,
+                const int height, const int width,
+                const unsigned char* __restrict__ born,
+                const unsigned char* __restrict__ survive,
+                const int moore)
+    {
+        /* Each block stages its tile, plus a one-cell halo, in shared
+         * memory, so every cell is read from global memory once instead of
+         * up to nine times. Indices wrap via modulo, which both applies the
+         * periodic boundary conditions and makes the threads hanging off a
+         * ragged board edge load the correctly wrapped halo cells. */
+        __shared__ unsigned char tile[BY + 2][BX + 2];
+        const int gx = blockIdx.x * BX + threadIdx.x;
+        const int gy = blockIdx.y * BY + threadIdx.y;
+        const int tx = threadIdx.x + 1;
+        const int ty = threadIdx.y + 1;
+
+        const int x = gx % width;
+        const int y = gy % height;
+        const int xm1 = (gx - 1 + width) % width;
+        const int xp1 = (gx + 1) % width;
+        const int ym1 = (gy - 1 + height) % height;
+        const int yp1 = (gy + 1) % height;
+
+        tile[ty][tx] = in[y * width + x];
+        if (threadIdx.x == 0)
+            tile[ty][0] = in[y * width + xm1];
+        if (threadIdx.x == BX - 1)
+            tile[ty][BX + 1] = in[y * width + xp1];
+        if (threadIdx.y == 0)
+            tile[0][tx] = in[ym1 * width + x];
+        if (threadIdx.y == BY - 1)
+            tile[BY + 1][tx] = in[yp1 * width + x];
+        if (threadIdx.x == 0 && threadIdx.y == 0)
+            tile[0][0] = in[ym1 * width + xm1];
+        if (threadIdx.x == BX - 1 && threadIdx.y == 0)
+            tile[0][BX + 1] = in[ym1 * width + xp1];
+        if (threadIdx.x == 0 && threadIdx.y == BY - 1)
+            tile[BY + 1][0] = in[yp1 * width + xm1];
+        if (threadIdx.x == BX - 1 && threadIdx.y == BY - 1)
+            tile[BY + 1][BX + 1] = in[yp1 * width + xp1];
+        __syncthreads();
+
+        if (gx >= width || gy >= height)
+            return;
+
+        unsigned int count = tile[ty - 1][tx] + tile[ty + 1][tx]
+                           + tile[ty][tx - 1] + tile[ty][tx + 1];
+        if (moore)
+            count += tile[ty - 1][tx - 1] + tile[ty - 1][tx + 1]
+                   + tile[ty + 1][tx - 1] + tile[ty + 1][tx + 1];
+        out[gy * width + gx] = tile[ty][tx] ? survive[count] : born[count];
+    }
+    ''', "update")
+
+# UTF-8 bytes used to draw dead and live cells ('█' encodes to 3 bytes;
+# shorter entries are NUL-padded, and the NULs are stripped when rendering).
+# Other potential symbols: ○, █, ▢, ■, ⚫, ⚪
+_CELL_BYTES = np.array([b' ', '█'.encode()], dtype='S3')
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, boundscheck=False)
+    def _numba_update(grid, out, born_mask, survive_mask, moore):
+        """Per-cell toroidal update, compiled by numba. See Grid.set_rules."""
+        height, width = grid.shape
+        # Row-tiles are independent, so spread them across the cores. Each
+        # tile is _BLOCK rows, far more than a cache line, so threads never
+        # share an output line (no false sharing).
+        for tile in numba.prange((height + _BLOCK - 1) // _BLOCK):
+            ii = tile * _BLOCK
+            i_end = min(ii + _BLOCK, height)
+            for jj in range(0, width, _BLOCK):
+                j_end = min(jj + _BLOCK, width)
+                if 0 < ii and i_end < height and 0 < jj and j_end < width:
+                    # Interior tiles never wrap, so skip the modulo
+                    # arithmetic and let the compiler vectorise the
+                    # plain-indexing path.
+                    for i in range(ii, i_end):
+                        for j in range(jj, j_end):
+                            count = (grid[i - 1, j] + grid[i + 1, j]
+                                     + grid[i, j - 1] + grid[i, j + 1])
+                            if moore:
+                                count += (grid[i - 1, j - 1]
+                                          + grid[i - 1, j + 1]
+                                          + grid[i + 1, j - 1]
+                                          + grid[i + 1, j + 1])
+                            if grid[i, j]:
+                                out[i, j] = survive_mask[count]
+                            else:
+                                out[i, j] = born_mask[count]
+                else:
+                    # Boundary tiles: even here, only cells actually on the
+                    # board's border wrap, so the bulk of the tile still
+                    # takes the plain-indexing path.
+                    i_lo = ii if ii > 0 else 1
+                    i_hi = i_end if i_end < height else height - 1
+                    j_lo = jj if jj > 0 else 1
+                    j_hi = j_end if j_end < width else width - 1
+                    for i in range(i_lo, i_hi):
+                        for j in range(j_lo, j_hi):
+                            count = (grid[i - 1, j] + grid[i + 1, j]
+                                     + grid[i, j - 1] + grid[i, j + 1])
+                            if moore:
+                                count += (grid[i - 1, j - 1]
+                                          + grid[i - 1, j + 1]
+                                          + grid[i + 1, j - 1]
+                                          + grid[i + 1, j + 1])
+                            if grid[i, j]:
+                                out[i, j] = survive_mask[count]
+                            else:
+                                out[i, j] = born_mask[count]
+                    # The border rows of this tile wrap via modulo...
+                    for i in range(ii, i_end):
+                        if 0 < i < height - 1:
+                            continue
+                        im1 = (i - 1) % height
+                        ip1 = (i + 1) % height
+                        for j in range(jj, j_end):
+                            jm1 = (j - 1) % width
+                            jp1 = (j + 1) % width
+                            count = (grid[im1, j] + grid[ip1, j]
+                                     + grid[i, jm1] + grid[i, jp1])
+                            if moore:
+                                count += (grid[im1, jm1] + grid[im1, jp1]
+                                          + grid[ip1, jm1] + grid[ip1, jp1])
+                            if grid[i, j]:
+                                out[i, j] = survive_mask[count]
+                            else:
+                                out[i, j] = born_mask[count]
+                    # ...as do the border columns, minus the corner cells the
+                    # border rows have already covered.
+                    for j in range(jj, j_end):
+                        if 0 < j < width - 1:
+                            continue
+                        jm1 = (j - 1) % width
+                        jp1 = (j + 1) % width
+                        for i in range(i_lo, i_hi):
+                            count = (grid[i - 1, j] + grid[i + 1, j]
+                                     + grid[i, jm1] + grid[i, jp1])
+                            if moore:
+                                count += (grid[i - 1, jm1] + grid[i - 1, jp1]
+                                          + grid[i + 1, jm1]
+                                          + grid[i + 1, jp1])
+                            if grid[i, j]:
+                                out[i, j] = survive_mask[count]
+                            else:
+                                out[i, j] = born_mask[count]
+
+    @numba.njit(cache=True, parallel=True, boundscheck=False)
+    def _numba_update_batched(grid, out, born_mask, survive_mask, moore,
+                              depth):
+        """
+        Advance every cell `depth` generations in one pass over the board.
+
+        Each _BLOCK x _BLOCK tile is copied into a scratch buffer with a
+        `depth`-cell halo (wrapping at the board edges), then stepped
+        `depth` times while it is hot in cache. The valid region of the
+        scratch shrinks by one cell per step, ending exactly on the tile,
+        so the board itself is read and written only once per `depth`
+        generations.
+        """
+        height, width = grid.shape
+        # Tiles only read the input board, so row-tiles parallelise the same
+        # way as in _numba_update.
+        for tile in numba.prange((height + _BLOCK - 1) // _BLOCK):
+            ii = tile * _BLOCK
+            bi = min(_BLOCK, height - ii)
+            for jj in range(0, width, _BLOCK):
+                bj = min(_BLOCK, width - jj)
+                hi = bi + 2 * depth
+                hj = bj + 2 * depth
+                scratch = np.empty((hi, hj), dtype=np.uint8)
+                spare = np.empty((hi, hj), dtype=np.uint8)
+                for i in range(hi):
+                    src_i = (ii + i - depth) % height
+                    for j in range(hj):
+                        scratch[i, j] = grid[src_i, (jj + j - depth) % width]
+                for t in range(depth):
+                    lo = t + 1
+                    for i in range(lo, hi - lo):
+                        for j in range(lo, hj - lo):
+                            count = (scratch[i - 1, j] + scratch[i + 1, j]
+                                     + scratch[i, j - 1] + scratch[i, j + 1])
+                            if moore:
+                                count += (scratch[i - 1, j - 1]
+                                          + scratch[i - 1, j + 1]
+                                          + scratch[i + 1, j - 1]
+                                          + scratch[i + 1, j + 1])
+                            if scratch[i, j]:
+                                spare[i, j] = survive_mask[count]
+                            else:
+                                spare[i, j] = born_mask[count]
+                    scratch, spare = spare, scratch
+                for i in range(bi):
+                    for j in range(bj):
+                        out[ii + i, jj + j] = scratch[depth + i, depth + j]
+
 
 class Grid():
     """
@@ -37,7 +268,8 @@ class Grid():
     The result is printed to the terminal to make an animation of the game.
     """
 
-    def __init__(self, width=None, height=None, fname=None, random=False):
+    def __init__(self, width=None, height=None, fname=None, random=False,
+                 use_gpu=False):
         """
         Initialise a grid object, where the game of life is carried out.
 
@@ -57,6 +289,11 @@ class Grid():
             grid is all dead. If a file-name is given the grid is initialised
             from the file and the value of random is ignored.
             The default is False.
+        use_gpu : boolean, optional
+            If True and the optional cupy package is available, update the
+            grid on the GPU (see set_update_method). If cupy cannot be
+            imported the grid quietly stays on the CPU.
+            The default is False.
 
         Returns
         -------
@@ -65,8 +302,17 @@ class Grid():
         """
         self.set_clear_terminal(True)
         self.set_fps(60)
+        # The first frame wipes the screen; after that the cursor is just
+        # sent home and the same-sized frame overwrites the old one.
+        self._clear_code = "\x1b[H\x1b[2J"
+        # On Windows 10+ running a (no-op) shell command switches the console
+        # into ANSI escape-code mode, which _display_frame relies on.
+        if os.name == 'nt':
+            os.system('')
         self.set_rules(born=[3], survive=[2, 3])  # Conway's rules, B3/S23.
         self.set_neighbourhood_type("Moore")  # Consider all surrounding cells.
+        self.set_update_method("gpu" if (use_gpu and cupy is not None)
+                               else "numpy")
 
         # Check that the neighbourhood type and rules are compatible:
         moore = (self.neighbourhood_type == "moore")
@@ -94,14 +340,40 @@ class Grid():
         self.width = width - 2
         self.height = height - 2
 
-        self.grid = np.zeros((self.height, self.width))
+        # uint8 is plenty for cells that are only ever 0 or 1, and moves an
+        # eighth of the bytes the default float64 would.
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        # Cache the wrapped neighbourhood indices of every row and column, so
+        # _view is not rebuilding the same little modular-arithmetic arrays
+        # for every cell of every generation.
+        rows = np.arange(self.height)[:, None]
+        cols = np.arange(self.width)[:, None]
+        self._moore_rows = (rows + np.array([-1, 0, 1])) % self.height
+        self._moore_cols = (cols + np.array([-1, 0, 1])) % self.width
+        self._vn_rows = (rows + np.array([0, 0, 0, -1, 1])) % self.height
+        self._vn_cols = (cols + np.array([-1, 0, 1, 0, 0])) % self.width
 
         if fname is not None:
             self.read_from_file(fname)
         elif random:
             rng = np.random.default_rng()
             self.grid = rng.integers(low=0, high=2,  # from the range [0, 2)
-                                     size=(self.height, self.width))
+                                     size=(self.height, self.width),
+                                     dtype=np.uint8)
+
+        # Scratch board the update methods write into, swapped with the grid
+        # each generation so no new board is allocated per frame.
+        self._buf = np.empty_like(self.grid)
+
+        # Reusable byte template for rendering frames: a column of pipes
+        # either side of the cells, and a newline, with the top/bottom bar
+        # encoded once. See _render_frame.
+        self._frame = np.empty((self.height, self.width + 3), dtype='S3')
+        self._frame[:, 0] = b'|'
+        self._frame[:, -2] = b'|'
+        self._frame[:, -1] = b'\n'
+        self._bar = ("—" * (self.width + 2) + "\n").encode()
 
     def set_clear_terminal(self, value):
         """
@@ -185,6 +457,16 @@ class Grid():
             raise TypeError(("The type of survive in Grid.set_rules() is "
                              "invalid. It should be a list or an integer."))
 
+        # Precompute boolean lookup tables indexed by neighbour count, so the
+        # update can apply the rules to the whole grid at once rather than
+        # checking `count in self.born` cell by cell. Sized to fit the largest
+        # rule given, so invalid rules are still caught nicely in __init__.
+        size = max(self.born + self.survive + [8]) + 1
+        self._born_mask = np.zeros(size, dtype=np.uint8)
+        self._born_mask[self.born] = 1
+        self._survive_mask = np.zeros(size, dtype=np.uint8)
+        self._survive_mask[self.survive] = 1
+
     def get_rules(self):
         """Return the rules as a string in the standard B/S notation."""
         # Convert each element in self.born into a string then concatenate
@@ -223,6 +505,60 @@ class Grid():
                               "It should either be vonNeumann or Moore "
                               "(case insensitive)."))
 
+    def set_update_method(self, method):
+        """
+        Set the implementation used by update_grid.
+
+        The possible methods are 'numpy', 'swar', 'numba' and 'c'. 'numpy'
+        (the default) counts neighbours with whole-grid array arithmetic.
+        'swar' packs the grid into 64-bit words, one cell per bit, and
+        updates 64 cells at a time with bitwise arithmetic; it only supports
+        the Moore neighbourhood. 'numba' runs the per-cell loop compiled to
+        machine code, and needs the optional numba package to be installed.
+        'c' uses the compiled (AVX2 where available) extension, which first
+        has to be built with `python setup.py build_ext --inplace`. 'gpu'
+        runs a tiled CUDA kernel on the graphics card, and needs the
+        optional cupy package; it is worthwhile for very large boards.
+
+        Parameters
+        ----------
+        method : string (case insensitive)
+            The update method: 'numpy', 'swar', 'numba', 'c' or 'gpu'.
+
+        Returns
+        -------
+        None.
+
+        """
+        if isinstance(method, str):
+            self.update_method = method.lower()
+        else:
+            raise TypeError(("set_update_method() has been passed a value "
+                            f"that is a {type(method)} as opposed to a "
+                             "string."))
+
+        if self.update_method not in ["numpy", "swar", "numba", "c", "gpu"]:
+            raise ValueError(("self.update_method has an invalid value. "
+                              "It should be numpy, swar, numba, c or gpu "
+                              "(case insensitive)."))
+
+        if self.update_method == "numba" and numba is None:
+            raise ImportError(("The numba update method needs the numba "
+                               "package, which could not be imported. "
+                               "Please install it, or use another method."))
+
+        if self.update_method == "c" and _gol_ext is None:
+            raise ImportError(("The c update method needs the _gol_ext "
+                               "extension, which could not be imported. "
+                               "Please build it with `python setup.py "
+                               "build_ext --inplace`, or use another "
+                               "method."))
+
+        if self.update_method == "gpu" and cupy is None:
+            raise ImportError(("The gpu update method needs the cupy "
+                               "package, which could not be imported. "
+                               "Please install it, or use another method."))
+
     def read_from_file(self, fname):
         """
         Open and read text file to generate starting grid.
@@ -251,7 +587,13 @@ class Grid():
         None.
 
         """
-        array = np.genfromtxt(fname, delimiter=1, dtype=int)
+        # Reading the raw bytes and subtracting ord('0') is far quicker than
+        # np.genfromtxt's general-purpose column parsing.
+        with open(fname, 'rb') as f:
+            lines = [line for line in f.read().splitlines() if line]
+        height, width = len(lines), len(lines[0])
+        array = (np.frombuffer(b''.join(lines), dtype=np.uint8)
+                 .reshape(height, width) - ord('0'))
         self.centre_grid(array)
 
     def centre_grid(self, array):
@@ -275,9 +617,7 @@ class Grid():
         hdiff = (self.height - h) // 2
         wdiff = (self.width - w) // 2
 
-        for i in range(h):
-            for j in range(w):
-                self.grid[i + hdiff, j + wdiff] = int(array[i, j])
+        self.grid[hdiff:hdiff + h, wdiff:wdiff + w] = array
 
     def print_title(self):
         """
@@ -298,39 +638,36 @@ class Grid():
 
     def _print_title_big(self):
         """Print a larger version of the title screen, for a normal grid."""
-        # Top bar.
-        print("—" * (self.width + 2))
-
-        # Blank space, and the walls to left and right.
-        for i in range((self.height - 3)//2):
-            print("|" + ' '*self.width + "|")
-
-        # The main text, centred on the grid.
-        print("|" + f"""{"Conway's":^{self.width}s}""" + "|")
-        print(f"|{' ':{self.width}}|")
-        print("|" + f"{'Game of Life':^{self.width}s}" + "|")
-
-        # Rest of the blank space, then the bottom bar.
-        for i in range((self.height - 3)//2):
-            print("|" + ' '*self.width + "|")
-        print("—" * (self.width + 2))
+        bar = "—" * (self.width + 2)
+        blank = "|" + ' '*self.width + "|"
+
+        # Top bar, blank space, the main text centred on the grid, the rest
+        # of the blank space, then the bottom bar - written in one go.
+        lines = [bar]
+        lines += [blank] * ((self.height - 3)//2)
+        lines.append("|" + f"""{"Conway's":^{self.width}s}""" + "|")
+        lines.append(blank)
+        lines.append("|" + f"{'Game of Life':^{self.width}s}" + "|")
+        lines += [blank] * ((self.height - 3)//2)
+        lines.append(bar)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def _print_title_small(self):
         """Print a smaller version of the title screen, for a small grid."""
-        # Top bar.
-        print("—" * (self.width + 2))
-
-        # Blank space, and the walls to left and right.
-        for i in range((self.height - 1)//2):
-            print("|" + ' '*self.width + "|")
+        bar = "—" * (self.width + 2)
+        blank = "|" + ' '*self.width + "|"
 
-        # The main text, centred on the grid.
-        print("|" + f"{'G o L':^{self.width}s}" + "|")
+        # As _print_title_big, with shorter text for the smaller grid.
+        lines = [bar]
+        lines += [blank] * ((self.height - 1)//2)
+        lines.append("|" + f"{'G o L':^{self.width}s}" + "|")
+        lines += [blank] * ((self.height - 1)//2)
+        lines.append(bar)
 
-        # Rest of the blank space, then the bottom bar.
-        for i in range((self.height - 1)//2):
-            print("|" + ' '*self.width + "|")
-        print("—" * (self.width + 2))
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def __str__(self):
         """
@@ -347,27 +684,31 @@ class Grid():
                      1001                 |█  █|
                                           ——————
         """
-        top = bottom = "—" * (self.width + 2)
-        top += "\n"
-        for i in range(self.height):
-            # Other potential symbols: ○, █, ▢, ■, ⚫, ⚪
-            top += f"|{''.join(['█' if x else ' ' for x in self.grid[i]])}|\n"
-        return top + bottom
+        # The frame renderer already produces exactly this, plus a trailing
+        # newline, as bytes.
+        return self._render_frame().decode()[:-1]
+
+    def _render_frame(self):
+        """
+        Render the grid as one UTF-8 bytes object, ready to write.
+
+        A single vectorised gather drops the cell glyphs into the
+        preallocated frame template, and one C-level replace strips the NUL
+        padding of the 1-byte glyphs, so there is no per-character Python
+        work. The result is str(self) plus a newline, encoded.
+        """
+        self._frame[:, 1:-2] = _CELL_BYTES[self.grid]
+        body = self._frame.tobytes().replace(b"\x00", b"")
+        return self._bar + body + self._bar
 
     def _view(self, i, j):
         """Return the view of the cell & neighbourhood, and the cell value."""
         if self.neighbourhood_type == "vonneumann":
-            cols = np.mod([i, i, i, i-1, i+1], self.height)
-            rows = np.mod([j-1, j, j+1, j, j], self.width)
-
-            view = self.grid[cols, rows]
+            view = self.grid[self._vn_rows[i], self._vn_cols[j]]
             cell = view[1]
 
         elif self.neighbourhood_type == "moore":
-            cols = np.mod([i-1, i, i+1], self.height)
-            rows = np.mod([j-1, j, j+1], self.width)
-
-            view = self.grid[np.ix_(cols, rows)]
+            view = self.grid[np.ix_(self._moore_rows[i], self._moore_cols[j])]
             cell = view[1, 1]
 
         else:
@@ -410,23 +751,243 @@ class Grid():
 
         neighbour_alive_count = np.count_nonzero(view) - cell_value
 
-        # Apply rules, first for births, then survivors.
-        # self.born/self.survive are lists of how many live cells must surround
-        # the dead/live cell for it to be alive at the start of the next turn.
-        if cell_value == 0 and neighbour_alive_count in self.born:
+        # Apply rules, first for births, then survivors, via the lookup
+        # tables built in set_rules - an O(1) index rather than scanning the
+        # born/survive lists for every cell.
+        if cell_value == 0 and self._born_mask[neighbour_alive_count]:
             return 1
-        elif cell_value == 1 and neighbour_alive_count in self.survive:
+        elif cell_value == 1 and self._survive_mask[neighbour_alive_count]:
             return 1
         else:
             return 0
 
     def update_grid(self):
-        """Update the grid."""
-        token_grid = np.empty_like(self.grid)
-        for i in range(self.height):
-            for j in range(self.width):
-                token_grid[i, j] = self._update_cell(i, j)
-        self.grid = token_grid
+        """
+        Update the grid, assuming it is toroidal.
+
+        Dispatches to the implementation chosen with set_update_method().
+        """
+        if self.update_method == "swar":
+            self._update_grid_swar()
+        elif self.update_method == "numba":
+            self._update_grid_numba()
+        elif self.update_method == "c":
+            self._update_grid_c()
+        elif self.update_method == "gpu":
+            self._update_grid_gpu()
+        else:
+            self._update_grid_numpy()
+
+    def _update_grid_numpy(self):
+        """
+        Update the grid with whole-grid array arithmetic.
+
+        Counts every cell's live neighbours as a sum of np.roll-shifted
+        copies of the grid (which gives the periodic boundary conditions for
+        free), then applies the born/survive rules to the whole grid at once
+        using the lookup tables built in set_rules().
+        """
+        g = self.grid
+        if self.neighbourhood_type == "moore":
+            # The 3x3 sum is separable: three-cell sums along each row
+            # first, then summing those vertically gives the full block;
+            # subtracting the cell itself leaves its eight neighbours.
+            # That is about four adds per cell instead of eight.
+            rows3 = np.roll(g, 1, axis=1) + g + np.roll(g, -1, axis=1)
+            neighbour_count = (np.roll(rows3, 1, axis=0) + rows3
+                               + np.roll(rows3, -1, axis=0) - g)
+        else:
+            neighbour_count = (np.roll(g, 1, axis=0) + np.roll(g, -1, axis=0)
+                               + np.roll(g, 1, axis=1)
+                               + np.roll(g, -1, axis=1))
+        self.grid = np.where(g, self._survive_mask[neighbour_count],
+                             self._born_mask[neighbour_count])
+
+    def update_grid_batched(self, depth):
+        """
+        Advance the grid `depth` generations in a single pass.
+
+        With the numba update method, tiles of the board are stepped `depth`
+        times while they are hot in cache (temporal tiling), so the board is
+        only read and written once per batch rather than once per
+        generation. With the gpu method the board stays on the device for
+        the whole batch and is copied back once. With the other methods
+        this simply calls update_grid() `depth` times.
+
+        Parameters
+        ----------
+        depth : int
+            The number of generations to advance by.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.update_method == "numba" and depth > 1:
+            _numba_update_batched(self.grid, self._buf, self._born_mask,
+                                  self._survive_mask,
+                                  self.neighbourhood_type == "moore", depth)
+            self.grid, self._buf = self._buf, self.grid
+        elif self.update_method == "gpu" and depth > 1:
+            self._update_grid_gpu(depth)
+        else:
+            for _ in range(depth):
+                self.update_grid()
+
+    def _update_grid_numba(self):
+        """
+        Update the grid with a compiled per-cell loop.
+
+        The same algorithm as _update_cell, but compiled to machine code by
+        numba, so there is no interpreter or allocation overhead per cell.
+        """
+        _numba_update(self.grid, self._buf, self._born_mask,
+                      self._survive_mask,
+                      self.neighbourhood_type == "moore")
+        self.grid, self._buf = self._buf, self.grid
+
+    def _update_grid_gpu(self, depth=1):
+        """
+        Update the grid on the GPU, advancing `depth` generations.
+
+        The board and rule tables are copied to the device, stepped by the
+        shared-memory tiled CUDA kernel (ping-ponging between two device
+        boards), and only the final board is copied back, so a batch of
+        generations pays for one round trip.
+        """
+        board = cupy.asarray(self.grid)
+        out = cupy.empty_like(board)
+        born = cupy.asarray(self._born_mask)
+        survive = cupy.asarray(self._survive_mask)
+        blocks = ((self.width + _GPU_BLOCK[0] - 1) // _GPU_BLOCK[0],
+                  (self.height + _GPU_BLOCK[1] - 1) // _GPU_BLOCK[1])
+        moore = np.int32(self.neighbourhood_type == "moore")
+        for _ in range(depth):
+            _gpu_update(blocks, _GPU_BLOCK,
+                        (board, out, np.int32(self.height),
+                         np.int32(self.width), born, survive, moore))
+            board, out = out, board
+        self.grid = cupy.asnumpy(board)
+
+    def _update_grid_c(self):
+        """
+        Update the grid with the compiled extension.
+
+        The extension updates the interior of the board with plain indexing
+        (32 cells per instruction where it was compiled with AVX2) and only
+        the border cells via modulo, writing into the scratch board, which
+        is then swapped with the grid.
+        """
+        _gol_ext.update(self.grid, self._buf, self.height, self.width,
+                        self._born_mask, self._survive_mask,
+                        1 if self.neighbourhood_type == "moore" else 0)
+        self.grid, self._buf = self._buf, self.grid
+
+    def _pack_grid(self):
+        """Pack the grid into 64-bit words, one cell per bit of each row."""
+        packed = np.packbits(self.grid, axis=1, bitorder="little")
+        # Pad each row of bytes up to a whole number of 64-bit words.
+        nbytes = 8 * ((packed.shape[1] + 7) // 8)
+        if nbytes != packed.shape[1]:
+            pad = np.zeros((self.height, nbytes - packed.shape[1]),
+                           dtype=np.uint8)
+            packed = np.concatenate([packed, pad], axis=1)
+        return packed.view(np.uint64)
+
+    def _unpack_grid(self, bits):
+        """Unpack rows of 64-bit words back into one uint8 cell per entry."""
+        return np.unpackbits(bits.view(np.uint8), axis=1, count=self.width,
+                             bitorder="little")
+
+    def _update_grid_swar(self):
+        """
+        Update the grid 64 cells at a time with bitwise arithmetic (SWAR).
+
+        Each row is packed into 64-bit words, one cell per bit, so a single
+        bitwise operation acts on 64 cells at once. The neighbour count of
+        every cell is built up as four bit-planes using a ladder of half and
+        full adders over shifted copies of the rows, and the born/survive
+        rules are applied by testing those planes against each rule count.
+        There are no branches and no per-cell work; only the Moore
+        neighbourhood is supported.
+        """
+        if self.neighbourhood_type != "moore":
+            raise ValueError(("The swar update method only supports the "
+                              "Moore neighbourhood. Use "
+                              "set_update_method('numpy') for vonNeumann."))
+
+        grid_bits = self._pack_grid()
+        remainder = self.width % 64
+
+        def shifted(rows):
+            """West and east neighbour bits of each cell, with wrap-around."""
+            # Shifting a word left by one moves each cell's west neighbour
+            # onto the cell; the bit lost at a word boundary is fetched from
+            # the neighbouring word. Likewise east, in the other direction.
+            west = (rows << np.uint64(1)) | (np.roll(rows, 1, axis=1)
+                                             >> np.uint64(63))
+            east = (rows >> np.uint64(1)) | (np.roll(rows, -1, axis=1)
+                                             << np.uint64(63))
+            if remainder:
+                # The top bits of the last word are padding, so the wrap
+                # between the first and last columns is spliced in by hand.
+                top_bit = np.uint64(1 << (remainder - 1))
+                west[:, 0] &= ~np.uint64(1)
+                west[:, 0] |= (rows[:, -1] >> np.uint64(remainder - 1)
+                               ) & np.uint64(1)
+                east[:, -1] &= ~top_bit
+                east[:, -1] |= (rows[:, 0] & np.uint64(1)
+                                ) << np.uint64(remainder - 1)
+            return west, east
+
+        mid = grid_bits
+        above = np.roll(grid_bits, 1, axis=0)
+        below = np.roll(grid_bits, -1, axis=0)
+        aw, ae = shifted(above)
+        mw, me = shifted(mid)
+        dw, de = shifted(below)
+
+        # Each row contributes a 2-bit count: a full adder for the three
+        # cells of the rows above and below, a half adder for the two
+        # horizontal neighbours in the cell's own row.
+        a0 = aw ^ above ^ ae
+        a1 = (aw & above) | (ae & (aw ^ above))
+        d0 = dw ^ below ^ de
+        d1 = (dw & below) | (de & (dw ^ below))
+        m0 = mw ^ me
+        m1 = mw & me
+
+        # Add the three 2-bit counts into bit-planes s0..s3, where the
+        # neighbour count of each cell is s0 + 2*s1 + 4*s2 + 8*s3.
+        s0 = a0 ^ d0 ^ m0
+        carry0 = (a0 & d0) | (m0 & (a0 ^ d0))
+        twos = a1 ^ d1 ^ m1
+        carry1 = (a1 & d1) | (m1 & (a1 ^ d1))
+        s1 = twos ^ carry0
+        carry2 = twos & carry0
+        s2 = carry1 ^ carry2
+        s3 = carry1 & carry2
+
+        # Build words marking where each born/survive count is matched.
+        born_word = np.zeros_like(grid_bits)
+        survive_word = np.zeros_like(grid_bits)
+        for count in range(9):
+            if not (self._born_mask[count] or self._survive_mask[count]):
+                continue
+            matches = np.full_like(grid_bits, ~np.uint64(0))
+            for bit, plane in enumerate((s0, s1, s2, s3)):
+                matches &= plane if (count >> bit) & 1 else ~plane
+            if self._born_mask[count]:
+                born_word |= matches
+            if self._survive_mask[count]:
+                survive_word |= matches
+
+        new_bits = (mid & survive_word) | (~mid & born_word)
+        if remainder:
+            new_bits[:, -1] &= np.uint64((1 << remainder) - 1)
+        self.grid_bits = new_bits
+        self.grid = self._unpack_grid(new_bits)
 
     def add_r_pentomino(self):
         """Put an R pentomino in the centre of the grid."""
@@ -452,9 +1013,9 @@ class Grid():
 
     def all_dead_or_alive(self):
         """Return True if every cell is dead, or every cell is alive."""
-        all_dead = np.count_nonzero(self.grid) == 0
-        all_alive = np.count_nonzero(self.grid) == self.grid.size
-        return all_dead or all_alive
+        # any()/all() stop at the first cell that settles the question,
+        # rather than counting the whole board twice.
+        return (not self.grid.any()) or self.grid.all()
 
     def iterate(self):
         """
@@ -464,10 +1025,18 @@ class Grid():
         printing the new grid.
         """
         self.update_grid()
+        self._display_frame()
+
+    def _display_frame(self):
+        """Write the current frame to the terminal in a single call."""
+        frame = b""
         if self.clear:
-            # Currently only tested on Windows 10 & WSL Ubuntu, no mac OS.
-            os.system('cls' if os.name == 'nt' else 'clear')
-        print(self)
+            # An ANSI escape code is orders of magnitude cheaper than
+            # spawning a cls/clear subprocess every frame.
+            frame = self._clear_code.encode()
+            self._clear_code = "\x1b[H"
+        sys.stdout.buffer.write(frame + self._render_frame())
+        sys.stdout.buffer.flush()
         time.sleep(1 / self.fps)
 
     def run(self, niter=None):
@@ -475,15 +1044,16 @@ class Grid():
         Start playing the game of life.
 
         Start with the current grid attribute, updating either niter times,
-        until the user interrupts the process, or until all the cells are
-        alive or all the cells are dead.
+        until the user interrupts the process, until all the cells are
+        alive or all the cells are dead, or until the grid settles into a
+        still life or a period-two oscillation (a blinker, say).
 
         Parameters
         ----------
         niter : int, optional
             The number of iterations the game in run for. The default is None,
-            meaning it runs until the user interrupts the process or all the
-            cells are alive or all the cells are dead.
+            meaning it runs until the user interrupts the process or the grid
+            reaches one of the stable states above.
 
         Returns
         -------
@@ -493,17 +1063,58 @@ class Grid():
         self.print_title()
         time.sleep(1)
 
-        if niter is None:
-            while True:
-                self.iterate()
-                # Once the grid is all alive or dead, stop
-                if self.all_dead_or_alive():
-                    break
-        else:
-            for i in range(niter):
-                self.iterate()
-                if self.all_dead_or_alive():
-                    break
+        # Hashes of the previous two grids. A grid matching the one from two
+        # generations ago has settled into a still life or a period-two
+        # oscillation, and will never do anything new.
+        prev1 = prev2 = None
+        count = 0
+        while niter is None or count < niter:
+            self.iterate()
+            count += 1
+            # Once the grid is all alive or dead, stop
+            if self.all_dead_or_alive():
+                break
+            state = hash(self.grid.tobytes())
+            if state == prev2:
+                break
+            prev1, prev2 = state, prev1
+
+    def run_batched(self, niter=None, depth=4):
+        """
+        Play the game of life, only showing every depth-th generation.
+
+        The same as run(), except the grid is advanced `depth` generations
+        between frames with update_grid_batched(), so the in-between
+        generations pay no rendering cost and (with the numba method) the
+        board is only read and written once per batch.
+
+        Parameters
+        ----------
+        niter : int, optional
+            The number of generations the game is run for. The default is
+            None, meaning it runs until the user interrupts the process or
+            all the cells are alive or all the cells are dead.
+        depth : int, optional
+            The number of generations advanced between frames.
+            The default is 4.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.print_title()
+        time.sleep(1)
+
+        done = 0
+        while niter is None or done < niter:
+            step = depth if niter is None else min(depth, niter - done)
+            self.update_grid_batched(step)
+            done += step
+            self._display_frame()
+            # Once the grid is all alive or dead, stop
+            if self.all_dead_or_alive():
+                break
 
 
 def main():
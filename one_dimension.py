@@ -21,16 +21,12 @@ def generate_rules(rule_num):
     Uses the notation that each possible set of rules is given as a string of
     8 0s and 1s, which means it can be represented with an integer from 0->255.
 
-    """
-    RULES = {}
-    keys = ["111", "110", "101", "100", "011", "010", "001", "000"]
-    # Convert the rule into a binary string
-    outcomes = [int(x) for x in f"{rule_num:08b}"]
-
-    for key, value in zip(keys, outcomes):
-        RULES[key] = value
+    Returns a lookup table: entry 4*left + 2*centre + right is the new value
+    of a cell, so a whole row can be updated with one indexing operation.
 
-    return RULES
+    """
+    # Bit k of the rule number is the outcome for neighbourhood pattern k.
+    return np.array([(rule_num >> k) & 1 for k in range(8)], dtype=np.uint8)
 
 # --- Printing nicely ---
 def pprint(array):
@@ -67,13 +63,16 @@ def main():
     grid[0, niter] = 1
 
     for i in range(1, niter):
-        for j in range(niter-i, niter+i+1):
-            # Currently the boundaries are just one either side of the centre
-            # to begin with, then two either side, then 3, 4, ...
-            # This is better than considering the whole row of zeros I think,
-            # because then the pattern grows.
-            rule = "".join(grid[i-1, j-1:j+2].astype(str))
-            grid[i, j] = RULES[rule]
+        # Currently the boundaries are just one either side of the centre
+        # to begin with, then two either side, then 3, 4, ...
+        # This is better than considering the whole row of zeros I think,
+        # because then the pattern grows.
+        lo, hi = niter - i, niter + i + 1
+        prev = grid[i-1]
+        # Turn each (left, centre, right) triple into an index into the rule
+        # lookup table, updating the whole row in one go.
+        index = 4*prev[lo-1:hi-1] + 2*prev[lo:hi] + prev[lo+1:hi+1]
+        grid[i, lo:hi] = RULES[index]
 
     pprint(grid)
 
@@ -0,0 +1,20 @@
+# Builds the optional C extension used by gameoflife.py's 'c' update method:
+#     python setup.py build_ext --inplace
+import platform
+
+from setuptools import Extension, setup
+
+# -mavx2 lets the extension do 32 cells per instruction; only ask for it on
+# machines that could have it.
+compile_args = ["-O3"]
+if platform.machine().lower() in ("x86_64", "amd64"):
+    compile_args.append("-mavx2")
+
+setup(
+    name="cellularautomata",
+    version="1.0",
+    description="Cellular automata that animate in the terminal.",
+    py_modules=["gameoflife", "one_dimension"],
+    ext_modules=[Extension("_gol_ext", ["_gol_ext.c"],
+                           extra_compile_args=compile_args)],
+)